@@ -4,6 +4,7 @@ from flask_socketio import SocketIO
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 from llm_coding_agent.agent import root_agent, list_directory_contents_recursive, read_file_content
+from sse_parser import iter_text_parts
 import requests
 import json
 import random
@@ -83,27 +84,11 @@ def api_run_sse():
         "streaming": True
     }
 
-    full_response_content = ""
     try:
         with requests.post(url, headers=headers, data=json.dumps(payload), stream=True) as response:
             response.raise_for_status()
             print(response)
-            for line in response.iter_lines():
-                print(line)
-                if line:
-                    decoded_line = line.decode('utf-8')
-                    if decoded_line.startswith('data: '):
-                        json_str = decoded_line[len('data: '):]
-                        try:
-                            event_data = json.loads(json_str)
-                            if 'content' in event_data and 'parts' in event_data['content']:
-                                for part in event_data['content']['parts']:
-                                    if 'text' in part:
-                                        full_response_content += part['text']
-                            if 'partial' in event_data and not event_data['partial']:
-                                break
-                        except json.JSONDecodeError:
-                            continue
+            full_response_content = ''.join(iter_text_parts(response.iter_content(chunk_size=8192)))
         print(f"Raw LLM Response: {full_response_content}")  # Added for debugging
         return jsonify({'response': full_response_content}), 200
 
@@ -146,30 +131,14 @@ def chat():
             "streaming": True
         }
 
-        full_response_content = ""
-        sse_response = requests.post(
+        with requests.post(
             sse_url,
             headers={'accept': 'application/json', 'Content-Type': 'application/json'},
             json=payload,
             stream=True,
             timeout=30
-        )
-
-        for line in sse_response.iter_lines():
-            if line:
-                decoded_line = line.decode('utf-8')
-                if decoded_line.startswith('data: '):
-                    json_str = decoded_line[len('data: '):]
-                    try:
-                        event_data = json.loads(json_str)
-                        if 'content' in event_data and 'parts' in event_data['content']:
-                            for part in event_data['content']['parts']:
-                                if 'text' in part:
-                                    full_response_content += part['text']
-                        if 'partial' in event_data and not event_data['partial']:
-                            break
-                    except json.JSONDecodeError:
-                        continue
+        ) as sse_response:
+            full_response_content = ''.join(iter_text_parts(sse_response.iter_content(chunk_size=8192)))
 
         print(f"Raw LLM Response: {full_response_content}")
 
@@ -0,0 +1,83 @@
+"""Benchmark the shared SSE parser against the old line-by-line loop.
+
+Usage: python bench_sse.py [num_events] [chunk_size]
+"""
+import json
+import sys
+import timeit
+
+from sse_parser import JSON_BACKEND, iter_text_parts
+
+
+def make_stream(num_events):
+    events = []
+    for i in range(num_events):
+        event = {
+            'id': f'evt-{i}',
+            'author': 'root_agent',
+            'content': {'parts': [{'text': f'token{i} '}], 'role': 'model'},
+            'partial': True,
+        }
+        events.append(b'data: ' + json.dumps(event).encode('utf-8') + b'\n\n')
+        if i % 50 == 0:
+            events.append(b': keep-alive\n\n')
+    final = {'content': {'parts': [{'text': 'done'}], 'role': 'model'}, 'partial': False}
+    events.append(b'data: ' + json.dumps(final).encode('utf-8') + b'\n\n')
+    return b''.join(events)
+
+
+def split_chunks(stream, chunk_size):
+    return [stream[i:i + chunk_size] for i in range(0, len(stream), chunk_size)]
+
+
+def iter_lines(chunks):
+    # Same splitting as requests.Response.iter_lines
+    pending = None
+    for chunk in chunks:
+        if pending is not None:
+            chunk = pending + chunk
+        lines = chunk.splitlines()
+        if lines and lines[-1] and chunk and lines[-1][-1] == chunk[-1]:
+            pending = lines.pop()
+        else:
+            pending = None
+        yield from lines
+    if pending is not None:
+        yield pending
+
+
+def legacy_parse(chunks):
+    full_response_content = ""
+    for line in iter_lines(chunks):
+        if line:
+            decoded_line = line.decode('utf-8')
+            if decoded_line.startswith('data: '):
+                json_str = decoded_line[len('data: '):]
+                try:
+                    event_data = json.loads(json_str)
+                    if 'content' in event_data and 'parts' in event_data['content']:
+                        for part in event_data['content']['parts']:
+                            if 'text' in part:
+                                full_response_content += part['text']
+                    if 'partial' in event_data and not event_data['partial']:
+                        break
+                except json.JSONDecodeError:
+                    continue
+    return full_response_content
+
+
+def shared_parse(chunks):
+    return ''.join(iter_text_parts(chunks))
+
+
+if __name__ == '__main__':
+    num_events = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 512
+    chunks = split_chunks(make_stream(num_events), chunk_size)
+
+    assert legacy_parse(chunks) == shared_parse(chunks)
+
+    print(f'{num_events} events, {len(chunks)} chunks of {chunk_size} bytes, JSON backend: {JSON_BACKEND}')
+    for name, func in (('legacy loop', legacy_parse), ('sse_parser', shared_parse)):
+        best = min(timeit.repeat(lambda: func(chunks), number=1, repeat=5))
+        print(f'{name:12} {best * 1000:8.1f} ms  {best / num_events * 1e6:6.2f} us/event')
@@ -0,0 +1,115 @@
+"""Tests for sse_parser.
+
+Run from backend/: python -m unittest test_sse_parser
+"""
+import importlib.util
+import sys
+import unittest
+from unittest import mock
+
+import sse_parser
+from sse_parser import SSEEvent, iter_sse_events
+
+
+# Mixed CRLF / lone CR / LF line endings, a heartbeat, event/id fields and a
+# data field split over two lines.
+MIXED_STREAM = (
+    b': heartbeat\r\n'
+    b'\r\n'
+    b'event: update\r'
+    b'id: 1\r'
+    b'data: {"content":\r'
+    b'data: {"parts":[{"text":"a"}]}}\r'
+    b'\r'
+    b'data: {"content":{"parts":[{"text":"b"}]}}\n'
+    b'\n'
+    b'id: 2\r\n'
+    b'data:{"content":{"parts":[{"text":"c"}]},"partial":false}\r\n'
+    b'\r\n'
+)
+
+MIXED_EVENTS = [
+    SSEEvent('update', b'{"content":\n{"parts":[{"text":"a"}]}}', '1'),
+    SSEEvent('message', b'{"content":{"parts":[{"text":"b"}]}}', '1'),
+    SSEEvent('message', b'{"content":{"parts":[{"text":"c"}]},"partial":false}', '2'),
+]
+
+
+def rechunk(stream, size):
+    return [stream[i:i + size] for i in range(0, len(stream), size)]
+
+
+def load_without_orjson():
+    """Import a fresh copy of sse_parser that falls back to the stdlib json."""
+    spec = importlib.util.spec_from_file_location('sse_parser_stdlib', sse_parser.__file__)
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict(sys.modules, {'orjson': None}):
+        spec.loader.exec_module(module)
+    return module
+
+
+class IterSSEEventsTest(unittest.TestCase):
+    def test_mixed_line_endings(self):
+        self.assertEqual(list(iter_sse_events([MIXED_STREAM])), MIXED_EVENTS)
+
+    def test_chunk_boundaries(self):
+        for size in range(1, len(MIXED_STREAM) + 1):
+            with self.subTest(chunk_size=size):
+                events = list(iter_sse_events(rechunk(MIXED_STREAM, size)))
+                self.assertEqual(events, MIXED_EVENTS)
+
+    def test_crlf_split_across_chunks(self):
+        chunks = [b'data: a\r', b'\ndata: b\r', b'\n\r', b'\n']
+        self.assertEqual(list(iter_sse_events(chunks)), [SSEEvent('message', b'a\nb', None)])
+
+    def test_final_event_without_blank_line_is_dispatched(self):
+        for stream in (b'data: a', b'data: a\n', b'data: a\r', b'data: a\r\n'):
+            with self.subTest(stream=stream):
+                self.assertEqual(list(iter_sse_events(rechunk(stream, 1))),
+                                 [SSEEvent('message', b'a', None)])
+
+    def test_leading_bom_is_stripped(self):
+        stream = b'\xef\xbb\xbfdata: a\n\n'
+        for size in range(1, len(stream) + 1):
+            with self.subTest(chunk_size=size):
+                self.assertEqual(list(iter_sse_events(rechunk(stream, size))),
+                                 [SSEEvent('message', b'a', None)])
+
+    def test_comments_and_empty_events_are_ignored(self):
+        stream = b': ping\n\n:\n\nevent: noop\n\nretry: 10\n\n'
+        self.assertEqual(list(iter_sse_events([stream])), [])
+
+    def test_invalid_utf8_in_fields_is_replaced(self):
+        events = list(iter_sse_events([b'event: a\xff\nid: \xfe\ndata: x\n\n']))
+        self.assertEqual(events, [SSEEvent('a\ufffd', b'x', '\ufffd')])
+
+
+class IterTextPartsTest(unittest.TestCase):
+    backend = sse_parser
+
+    def test_joins_text_and_stops_on_final_event(self):
+        stream = MIXED_STREAM + b'data: {"content":{"parts":[{"text":"late"}]}}\n\n'
+        for size in (1, 2, 3, 7, len(stream)):
+            with self.subTest(chunk_size=size):
+                text = ''.join(self.backend.iter_text_parts(rechunk(stream, size)))
+                self.assertEqual(text, 'abc')
+
+    def test_skips_invalid_events(self):
+        stream = (
+            b'data: not json\n\n'
+            b'data: \xff\n\n'
+            b'data: [1, 2]\n\n'
+            b'data: {"content":{"parts":[{"text":"ok"}]}}\n\n'
+        )
+        self.assertEqual(''.join(self.backend.iter_text_parts([stream])), 'ok')
+
+
+class IterTextPartsStdlibJSONTest(IterTextPartsTest):
+    backend = load_without_orjson()
+
+    def test_uses_stdlib_json(self):
+        self.assertEqual(self.backend.JSON_BACKEND, 'json')
+
+
+if __name__ == '__main__':
+    unittest.main()